@@ -6,14 +6,22 @@ Exposes endpoints to analyze a stock using existing `stock_analyzer` module
 and returns clean JSON suitable for a React frontend.
 """
 
+import asyncio
 import os
 import sys
 import io
-from typing import Any, Dict, List, Optional
-import tempfile
-
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import orjson
+import pandas as pd
+from cachetools import TTLCache
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
@@ -27,8 +35,9 @@ if PROJECT_ROOT not in sys.path:
 try:
     # Ensure matplotlib runs headless for server-side rendering
     os.environ.setdefault("MPLBACKEND", "Agg")
-    from stock_analyzer import analyze_stock, StockAnalyzer
+    from stock_analyzer import StockAnalyzer
     from stock_visualizer import StockVisualizer
+    import matplotlib.pyplot as plt
 except Exception as import_exc:  # pragma: no cover
     raise RuntimeError(
         "Failed to import stock_analyzer. Ensure the backend is run from project root or PYTHONPATH is set."
@@ -52,6 +61,139 @@ class AnalyzeResponse(BaseModel):
     dates: List[str]
 
 
+async def _stream_json(head: Dict[str, Any], series: Dict[str, Any], dates: List[str]) -> AsyncIterator[bytes]:
+    """
+    Yield the analyze payload as JSON fragments, one series column at a time,
+    so the full response body is never materialized. orjson handles numpy
+    arrays/scalars and writes NaN as null.
+    """
+    def dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+
+    yield dumps(head)[:-1] + b',"series":{'
+    for i, (key, values) in enumerate(series.items()):
+        yield (b"," if i else b"") + dumps(key) + b":" + dumps(values)
+    yield b'},"dates":' + dumps(dates) + b"}"
+
+
+# Response `series` keys mapped to indicator DataFrame columns
+SERIES_COLUMNS: Dict[str, str] = {
+    "close": "Close",
+    "sma20": "SMA_20",
+    "sma50": "SMA_50",
+    "bbUpper": "BB_Upper",
+    "bbLower": "BB_Lower",
+    "volume": "Volume",
+    "macd": "MACD",
+    "macdSignal": "MACD_Signal",
+    "macdHist": "MACD_Hist",
+    "rsi": "RSI",
+}
+
+
+# Blocking work is kept off the event loop: yfinance fetches run on threads,
+# TA-Lib analysis and matplotlib rendering (GIL-bound) run in separate processes
+IO_POOL = ThreadPoolExecutor(max_workers=32, thread_name_prefix="fetch")
+
+
+def _new_cpu_pool() -> ProcessPoolExecutor:
+    """Process pool for analysis and rendering"""
+    # Workers are spawned, not forked: forking a threaded server (executor threads,
+    # native thread pools) can leave locks held in the child
+    return ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=multiprocessing.get_context("spawn"))
+
+
+CPU_POOL = _new_cpu_pool()
+
+
+async def _run_cpu(func: Callable[..., Any], *args: Any) -> Any:
+    """
+    Run `func` in CPU_POOL, replacing the pool and retrying once if it broke
+
+    A worker that dies (OOM kill, native crash in TA-Lib or Agg) marks the
+    executor as broken for good; without a fresh pool every later request
+    would fail until the server restarts.
+    """
+    global CPU_POOL
+    loop = asyncio.get_running_loop()
+    pool = CPU_POOL
+    try:
+        return await loop.run_in_executor(pool, func, *args)
+    except BrokenProcessPool:
+        # Concurrent requests may all see the same broken pool; replace it once
+        if CPU_POOL is pool:
+            CPU_POOL = _new_cpu_pool()
+            pool.shutdown(wait=False, cancel_futures=True)
+        return await loop.run_in_executor(CPU_POOL, func, *args)
+
+
+# (data_with_indicators, levels, trend, summary, dates)
+Analysis = Tuple[pd.DataFrame, Dict[str, List[float]], Dict[str, Any], Dict[str, Any], List[str]]
+
+
+def _fetch(symbol: str, period: str) -> pd.DataFrame:
+    """Download price history; network-bound, runs on IO_POOL"""
+    return StockAnalyzer(symbol, period).data
+
+
+def _iso_dates(index: pd.Index) -> List[str]:
+    """ISO 8601 strings for the index, formatted in one vectorized call"""
+    if not isinstance(index, pd.DatetimeIndex):
+        return index.astype(str).tolist()
+    if index.tz is None:
+        return index.strftime("%Y-%m-%dT%H:%M:%S").tolist()
+    # %z gives "-0500"; isoformat() (and the frontend) use "-05:00"
+    return index.strftime("%Y-%m-%dT%H:%M:%S%z").str.replace(r"(\d{2})$", r":\1", regex=True).tolist()
+
+
+def _compute(symbol: str, period: str, data: pd.DataFrame) -> Analysis:
+    """Indicators, levels, trend and summary for fetched data; CPU-bound, runs in CPU_POOL"""
+    analyzer = StockAnalyzer(symbol, period, data=data)
+    data_with_indicators = analyzer.calculate_technical_indicators()
+    levels = analyzer.find_support_resistance_levels()
+    return (
+        data_with_indicators,
+        levels,
+        analyzer.get_trend_analysis(),
+        analyzer.get_price_summary(),
+        _iso_dates(data_with_indicators.index),
+    )
+
+
+# Analysis results keyed by (symbol, period); refreshed every 5 minutes.
+# Only touched from the event loop, so no thread locking is needed.
+_ANALYSIS_CACHE: TTLCache = TTLCache(maxsize=256, ttl=300)
+# Per-key locks and how many requests currently hold or wait on each; an entry
+# is dropped only when the last of them leaves, so a key never has two locks
+_KEY_LOCKS: Dict[Tuple[str, str], asyncio.Lock] = {}
+_KEY_USERS: Dict[Tuple[str, str], int] = {}
+
+
+async def _get_analysis(symbol: str, period: str) -> Analysis:
+    """Cached fetch + compute; concurrent misses for one key share a single run"""
+    key = (symbol.upper(), period)
+    result = _ANALYSIS_CACHE.get(key)
+    if result is not None:
+        return result
+
+    lock = _KEY_LOCKS.setdefault(key, asyncio.Lock())
+    _KEY_USERS[key] = _KEY_USERS.get(key, 0) + 1
+    try:
+        async with lock:
+            result = _ANALYSIS_CACHE.get(key)
+            if result is None:
+                loop = asyncio.get_running_loop()
+                data = await loop.run_in_executor(IO_POOL, _fetch, *key)
+                result = await _run_cpu(_compute, *key, data)
+                _ANALYSIS_CACHE[key] = result
+    finally:
+        _KEY_USERS[key] -= 1
+        if not _KEY_USERS[key]:
+            del _KEY_USERS[key]
+            del _KEY_LOCKS[key]
+    return result
+
+
 app = FastAPI(title="Stock Analysis API", version="1.0.0")
 
 # CORS for local dev (Vite default port 5173)
@@ -62,6 +204,9 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# The analyze payload is mostly repeated numeric text and compresses well;
+# PNG charts are skipped by the middleware's default excluded content types.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
 
 @app.get("/health")
@@ -75,37 +220,14 @@ def api_health() -> Dict[str, str]:
     return {"status": "ok"}
 
 
-def _series_to_list(values) -> List[Optional[float]]:
-    # Convert pandas series to JSON-serializable list with None for NaN
-    result: List[Optional[float]] = []
-    for v in values:
-        if v is None:
-            result.append(None)
-        else:
-            try:
-                if hasattr(v, "__float__"):
-                    f = float(v)  # type: ignore
-                    if f != f:  # NaN check
-                        result.append(None)
-                    else:
-                        result.append(f)
-                else:
-                    result.append(None)
-            except Exception:
-                result.append(None)
-    return result
-
-
 @app.post("/api/analyze", response_model=AnalyzeResponse)
-def analyze(req: AnalyzeRequest) -> AnalyzeResponse:
+async def analyze(req: AnalyzeRequest) -> StreamingResponse:
     symbol = req.symbol.strip().upper()
     if not symbol:
         raise HTTPException(status_code=400, detail="Symbol is required")
 
     try:
-        analyzer, data_with_indicators, levels = analyze_stock(symbol, req.period)
-        trend = analyzer.get_trend_analysis()
-        summary = analyzer.get_price_summary()
+        data_with_indicators, levels, trend, summary, dates = await _get_analysis(symbol, req.period)
 
         # Merge key trend metrics into summary for convenience
         summary_out: Dict[str, Any] = {
@@ -118,97 +240,96 @@ def analyze(req: AnalyzeRequest) -> AnalyzeResponse:
             "sma_50": trend.get("sma_50"),
         }
 
-        # Prepare timeseries for charts
-        index = data_with_indicators.index
-        dates = [
-            (i.isoformat() if hasattr(i, "isoformat") else str(i)) for i in index
-        ]
-
-        def get(col: str) -> List[Optional[float]]:
-            return _series_to_list(data_with_indicators[col]) if col in data_with_indicators.columns else []
-
-        series = {
-            "close": get("Close"),
-            "sma20": get("SMA_20"),
-            "sma50": get("SMA_50"),
-            "bbUpper": get("BB_Upper"),
-            "bbLower": get("BB_Lower"),
-            "volume": get("Volume"),
-            "macd": get("MACD"),
-            "macdSignal": get("MACD_Signal"),
-            "macdHist": get("MACD_Hist"),
-            "rsi": get("RSI"),
+        # Extract all chart columns in one pass as float32: ~7 significant digits
+        # is plenty for browser charts and halves the encoded size. orjson
+        # serializes the (contiguous) rows directly and writes NaN as null.
+        columns = [col for col in SERIES_COLUMNS.values() if col in data_with_indicators.columns]
+        rows = np.ascontiguousarray(data_with_indicators[columns].to_numpy(dtype=np.float32).T)
+        values = dict(zip(columns, rows))
+        series = {key: values.get(col, []) for key, col in SERIES_COLUMNS.items()}
+
+        head = {
+            "symbol": symbol,
+            "period": req.period,
+            "summary": summary_out,
+            "levels": levels,
         }
-
-        return AnalyzeResponse(
-            symbol=symbol,
-            period=req.period,
-            summary=summary_out,
-            levels=levels,
-            series=series,
-            dates=dates,
-        )
+        return StreamingResponse(_stream_json(head, series, dates), media_type="application/json")
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.get("/api/chart")
-def chart(symbol: str, period: str = "1y", type: str = "comprehensive"):
-    """
-    Generate a chart image using StockVisualizer and return it as PNG.
-    Types: comprehensive | support_resistance | trend | price | volume | macd | rsi
-    """
-    symbol = symbol.strip().upper()
-    if not symbol:
-        raise HTTPException(status_code=400, detail="Symbol is required")
+# Charts are displayed in the browser; 300 dpi print resolution is wasted there
+API_CHART_DPI = 80
 
-    try:
-        analyzer, data_with_indicators, levels = analyze_stock(symbol, period)
-        visualizer = StockVisualizer(data_with_indicators, symbol)
+CHART_TYPES = {"comprehensive", "support_resistance", "sr", "levels", "trend", "price", "volume", "macd", "rsi"}
 
-        chart_type = type.lower()
-        # Use a temporary PNG file to leverage existing save_path logic
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
-            tmp_path = tmp.name
 
+def _render_chart(data_with_indicators, symbol: str, levels: Dict[str, List[float]], chart_type: str) -> bytes:
+    """Render a chart to PNG bytes; runs inside CPU_POOL worker processes"""
+    visualizer = StockVisualizer(data_with_indicators, symbol)
+
+    # matplotlib writes the PNG straight into memory; no temp file round-trip
+    buf = io.BytesIO()
+
+    try:
         if chart_type == "comprehensive":
             visualizer.plot_comprehensive_chart(
                 support_levels=levels.get("support", []),
                 resistance_levels=levels.get("resistance", []),
-                save_path=tmp_path,
+                save_path=buf,
+                dpi=API_CHART_DPI,
             )
         elif chart_type in ("support_resistance", "sr", "levels"):
             visualizer.plot_support_resistance_chart(
                 support_levels=levels.get("support", []),
                 resistance_levels=levels.get("resistance", []),
-                save_path=tmp_path,
+                save_path=buf,
+                dpi=API_CHART_DPI,
             )
         elif chart_type == "trend":
-            visualizer.plot_trend_analysis(save_path=tmp_path)
+            visualizer.plot_trend_analysis(save_path=buf, dpi=API_CHART_DPI)
         elif chart_type == "price":
             visualizer.plot_price_chart(
                 support_levels=levels.get("support", []),
                 resistance_levels=levels.get("resistance", []),
-                save_path=tmp_path,
+                save_path=buf,
+                dpi=API_CHART_DPI,
             )
         elif chart_type == "volume":
-            visualizer.plot_volume_chart(save_path=tmp_path)
+            visualizer.plot_volume_chart(save_path=buf, dpi=API_CHART_DPI)
         elif chart_type == "macd":
-            visualizer.plot_macd_chart(save_path=tmp_path)
+            visualizer.plot_macd_chart(save_path=buf, dpi=API_CHART_DPI)
         elif chart_type == "rsi":
-            visualizer.plot_rsi_chart(save_path=tmp_path)
+            visualizer.plot_rsi_chart(save_path=buf, dpi=API_CHART_DPI)
         else:
-            raise HTTPException(status_code=400, detail="Unknown chart type")
-
-        # Read image bytes and return
-        with open(tmp_path, "rb") as f:
-            data = f.read()
-        try:
-            os.remove(tmp_path)
-        except OSError:
-            pass
+            raise ValueError(f"Unknown chart type: {chart_type}")
+
+        return buf.getvalue()
+    finally:
+        # Workers are long-lived; don't let figures accumulate between requests
+        plt.close("all")
+
+
+@app.get("/api/chart")
+async def chart(symbol: str, period: str = "1y", type: str = "comprehensive"):
+    """
+    Generate a chart image using StockVisualizer and return it as PNG.
+    Types: comprehensive | support_resistance | trend | price | volume | macd | rsi
+    """
+    symbol = symbol.strip().upper()
+    if not symbol:
+        raise HTTPException(status_code=400, detail="Symbol is required")
+
+    chart_type = type.lower()
+    if chart_type not in CHART_TYPES:
+        raise HTTPException(status_code=400, detail="Unknown chart type")
+
+    try:
+        data_with_indicators, levels, _, _, _ = await _get_analysis(symbol, period)
+        data = await _run_cpu(_render_chart, data_with_indicators, symbol, levels, chart_type)
 
         return StreamingResponse(io.BytesIO(data), media_type="image/png")
     except HTTPException:
@@ -3,6 +3,8 @@ Stock Analysis Module using TA-Lib
 Provides technical analysis functions for stock data including support/resistance levels
 """
 
+import functools
+import time
 import yfinance as yf
 import pandas as pd
 import numpy as np
@@ -11,6 +13,124 @@ from typing import Tuple, List, Dict, Optional
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to the NumPy implementation
+    njit = None
+
+
+def _find_extrema_numpy(low: np.ndarray, high: np.ndarray, window: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Flag bars that are the minimum of `low` / maximum of `high` within
+    `window` bars on each side
+    
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Boolean support and resistance masks
+    """
+    # Edge bars without a full centered window get NaN and never match
+    span = 2 * window + 1
+    rolling_min = pd.Series(low).rolling(span, center=True).min().to_numpy()
+    rolling_max = pd.Series(high).rolling(span, center=True).max().to_numpy()
+    return low == rolling_min, high == rolling_max
+
+
+if njit is not None:
+    # Serial on purpose: the scan takes microseconds for a few thousand bars, and
+    # a parallel threading layer is unsafe to drive from the API's worker threads
+    @njit(cache=True)
+    def _find_extrema_numba(low: np.ndarray, high: np.ndarray, window: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Numba version of `_find_extrema_numpy`: one fused pass over both series"""
+        n = low.shape[0]
+        is_support = np.zeros(n, dtype=np.bool_)
+        is_resistance = np.zeros(n, dtype=np.bool_)
+        for i in range(window, n - window):
+            # Comparisons are written so that NaN never qualifies as an extremum
+            is_min = True
+            for j in range(1, window + 1):
+                if not (low[i] <= low[i - j] and low[i] <= low[i + j]):
+                    is_min = False
+                    break
+            is_max = True
+            for j in range(1, window + 1):
+                if not (high[i] >= high[i - j] and high[i] >= high[i + j]):
+                    is_max = False
+                    break
+            is_support[i] = is_min
+            is_resistance[i] = is_max
+        return is_support, is_resistance
+else:
+    _find_extrema_numba = None
+
+try:
+    # Ahead-of-time compiled scan, when it has been built
+    # (`cythonize -i stock_analyzer_ext.pyx`): no JIT warm-up in each process
+    from stock_analyzer_ext import find_extrema as _find_extrema_ext
+except ImportError:
+    _find_extrema_ext = None
+
+
+def _matches_numpy_extrema(kernel) -> bool:
+    """
+    Whether `kernel` flags the same bars as `_find_extrema_numpy`
+    
+    Covers NaN gaps, runs of equal prices and series shorter than a full
+    window, where the implementations are easiest to let drift apart.
+    """
+    rng = np.random.default_rng(0)
+    low = 100 + np.cumsum(rng.normal(0, 1, 300))
+    high = low + rng.uniform(0, 2, 300)
+    low[[20, 21, 150]] = np.nan
+    high[[20, 90]] = np.nan
+    low[200:210] = low[200]
+    high[240:250] = high[240]
+    for n in (300, 11, 10, 3, 0):
+        for window in (1, 5):
+            expected = _find_extrema_numpy(low[:n], high[:n], window)
+            actual = kernel(low[:n], high[:n], window)
+            if not all(np.array_equal(e, a) for e, a in zip(expected, actual)):
+                return False
+    return True
+
+
+def _select_find_extrema():
+    """
+    Fastest installed extrema scan that agrees with the NumPy reference
+    
+    Which kernels exist depends on the deployment, so each is checked once at
+    import; one that disagrees is skipped rather than silently changing the
+    support/resistance levels on only some machines.
+    """
+    for name, kernel in (('compiled', _find_extrema_ext), ('Numba', _find_extrema_numba)):
+        if kernel is None:
+            continue
+        if _matches_numpy_extrema(kernel):
+            return kernel
+        print(f"Warning: {name} extrema scan disagrees with the NumPy version; not using it")
+    return _find_extrema_numpy
+
+
+_find_extrema = _select_find_extrema()
+
+
+# Cached histories are reused for this many seconds before yfinance is queried again
+HISTORY_CACHE_SECONDS = 300
+
+
+@functools.lru_cache(maxsize=128)
+def _cached_history(symbol: str, period: str, bucket: int) -> pd.DataFrame:
+    """
+    Download price history for `symbol`, memoized per process
+    
+    `bucket` is the current HISTORY_CACHE_SECONDS time slot, so entries go
+    stale when the slot rolls over. Failed downloads raise and are not cached.
+    The returned DataFrame is shared between callers and must not be mutated.
+    """
+    data = yf.Ticker(symbol).history(period=period)
+    if data.empty:
+        raise ValueError(f"No data found for symbol {symbol}")
+    print(f"Successfully fetched {len(data)} days of data for {symbol}")
+    return data
+
 
 class StockAnalyzer:
     """
@@ -18,27 +138,37 @@ class StockAnalyzer:
     Provides methods for technical indicators and support/resistance detection
     """
     
-    def __init__(self, symbol: str, period: str = "1y"):
+    def __init__(self, symbol: str, period: str = "1y", data: Optional[pd.DataFrame] = None):
         """
         Initialize StockAnalyzer with symbol and time period
         
         Args:
             symbol (str): Stock symbol (e.g., 'AAPL')
             period (str): Time period for data ('1d', '5d', '1mo', '3mo', '6mo', '1y', '2y', '5y', '10y', 'ytd', 'max')
+            data (Optional[pd.DataFrame]): Previously fetched price history; skips the download when given
         """
         self.symbol = symbol.upper()
         self.period = period
-        self.data = None
-        self._fetch_data()
+        self.data = data
+        self._indicators: Optional[pd.DataFrame] = None
+        if self.data is None:
+            self._fetch_data()
+        self._cache_arrays()
+    
+    def _cache_arrays(self) -> None:
+        """Keep NumPy views of the price columns for cheap scalar access and reductions"""
+        if self.data is None or self.data.empty:
+            return
+        self._close_arr = self.data['Close'].to_numpy()
+        self._high_arr = self.data['High'].to_numpy()
+        self._low_arr = self.data['Low'].to_numpy()
+        self._vol_arr = self.data['Volume'].to_numpy()
     
     def _fetch_data(self) -> None:
         """Fetch stock data using yfinance"""
         try:
-            ticker = yf.Ticker(self.symbol)
-            self.data = ticker.history(period=self.period)
-            if self.data.empty:
-                raise ValueError(f"No data found for symbol {self.symbol}")
-            print(f"Successfully fetched {len(self.data)} days of data for {self.symbol}")
+            bucket = int(time.time() // HISTORY_CACHE_SECONDS)
+            self.data = _cached_history(self.symbol, self.period, bucket)
         except Exception as e:
             print(f"Error fetching data for {self.symbol}: {e}")
             raise
@@ -47,46 +177,64 @@ class StockAnalyzer:
         """
         Calculate various technical indicators using TA-Lib
         
+        The result is computed once and cached on the analyzer, so repeated
+        calls (e.g. from get_trend_analysis) return the same DataFrame.
+        
         Returns:
             pd.DataFrame: DataFrame with original data and technical indicators
         """
         if self.data is None or self.data.empty:
             raise ValueError("No data available. Please fetch data first.")
         
-        df = self.data.copy()
+        if self._indicators is not None:
+            return self._indicators
+        
+        df = self.data
+        
+        # TA-Lib works on contiguous float64 arrays; convert each input once
+        # instead of letting every indicator call re-coerce the Series
+        close = np.ascontiguousarray(df['Close'].to_numpy(dtype=np.float64))
+        high = np.ascontiguousarray(df['High'].to_numpy(dtype=np.float64))
+        low = np.ascontiguousarray(df['Low'].to_numpy(dtype=np.float64))
+        volume = np.ascontiguousarray(df['Volume'].to_numpy(dtype=np.float64))
+        
+        # Indicator columns are collected here and attached in a single
+        # assign() below, which is the only copy of the price data
+        out: Dict[str, np.ndarray] = {}
         
         # Moving Averages
-        df['SMA_20'] = talib.SMA(df['Close'], timeperiod=20)
-        df['SMA_50'] = talib.SMA(df['Close'], timeperiod=50)
-        df['EMA_12'] = talib.EMA(df['Close'], timeperiod=12)
-        df['EMA_26'] = talib.EMA(df['Close'], timeperiod=26)
+        out['SMA_20'] = talib.SMA(close, timeperiod=20)
+        out['SMA_50'] = talib.SMA(close, timeperiod=50)
+        out['EMA_12'] = talib.EMA(close, timeperiod=12)
+        out['EMA_26'] = talib.EMA(close, timeperiod=26)
         
         # MACD
-        df['MACD'], df['MACD_Signal'], df['MACD_Hist'] = talib.MACD(
-            df['Close'], fastperiod=12, slowperiod=26, signalperiod=9
+        out['MACD'], out['MACD_Signal'], out['MACD_Hist'] = talib.MACD(
+            close, fastperiod=12, slowperiod=26, signalperiod=9
         )
         
         # RSI
-        df['RSI'] = talib.RSI(df['Close'], timeperiod=14)
+        out['RSI'] = talib.RSI(close, timeperiod=14)
         
         # Bollinger Bands
-        df['BB_Upper'], df['BB_Middle'], df['BB_Lower'] = talib.BBANDS(
-            df['Close'], timeperiod=20, nbdevup=2, nbdevdn=2, matype=0
+        out['BB_Upper'], out['BB_Middle'], out['BB_Lower'] = talib.BBANDS(
+            close, timeperiod=20, nbdevup=2, nbdevdn=2, matype=0
         )
         
         # Stochastic
-        df['STOCH_K'], df['STOCH_D'] = talib.STOCH(
-            df['High'], df['Low'], df['Close'], 
+        out['STOCH_K'], out['STOCH_D'] = talib.STOCH(
+            high, low, close, 
             fastk_period=14, slowk_period=3, slowd_period=3
         )
         
         # Volume indicators
-        df['OBV'] = talib.OBV(df['Close'], df['Volume'])
+        out['OBV'] = talib.OBV(close, volume)
         
         # ATR (Average True Range) for volatility
-        df['ATR'] = talib.ATR(df['High'], df['Low'], df['Close'], timeperiod=14)
+        out['ATR'] = talib.ATR(high, low, close, timeperiod=14)
         
-        return df
+        self._indicators = df.assign(**out)
+        return self._indicators
     
     def find_support_resistance_levels(self, window: int = 20, threshold: float = 0.02) -> Dict[str, List[float]]:
         """
@@ -102,33 +250,28 @@ class StockAnalyzer:
         if self.data is None or self.data.empty:
             raise ValueError("No data available. Please fetch data first.")
         
-        df = self.data.copy()
+        # Read-only access: the extrema scan works on NumPy arrays, so no copy of self.data
+        low = np.ascontiguousarray(self.data['Low'].to_numpy(dtype=np.float64))
+        high = np.ascontiguousarray(self.data['High'].to_numpy(dtype=np.float64))
         
         # Find local minima (support) and maxima (resistance)
-        support_levels = []
-        resistance_levels = []
-        
-        for i in range(window, len(df) - window):
-            # Check for local minimum (support)
-            if all(df['Low'].iloc[i] <= df['Low'].iloc[i-j] for j in range(1, window+1)) and \
-               all(df['Low'].iloc[i] <= df['Low'].iloc[i+j] for j in range(1, window+1)):
-                support_levels.append(df['Low'].iloc[i])
-            
-            # Check for local maximum (resistance)
-            if all(df['High'].iloc[i] >= df['High'].iloc[i-j] for j in range(1, window+1)) and \
-               all(df['High'].iloc[i] >= df['High'].iloc[i+j] for j in range(1, window+1)):
-                resistance_levels.append(df['High'].iloc[i])
+        is_support, is_resistance = _find_extrema(low, high, window)
+        support_levels = low[is_support].tolist()
+        resistance_levels = high[is_resistance].tolist()
         
         # Filter levels based on threshold to avoid duplicates
         def filter_levels(levels: List[float], threshold: float) -> List[float]:
             if not levels:
                 return []
             
-            filtered = [levels[0]]
-            for level in levels[1:]:
-                if all(abs(level - existing) > threshold * existing for existing in filtered):
+            # Sweep in ascending order, keeping a level only if it is far enough
+            # above the last kept one; the result is already sorted
+            ordered = np.sort(np.asarray(levels)).tolist()
+            filtered = [ordered[0]]
+            for level in ordered[1:]:
+                if abs(level - filtered[-1]) > threshold * filtered[-1]:
                     filtered.append(level)
-            return sorted(filtered)
+            return filtered
         
         support_levels = filter_levels(support_levels, threshold)
         resistance_levels = filter_levels(resistance_levels, threshold)
@@ -142,20 +285,24 @@ class StockAnalyzer:
         """Get the current stock price"""
         if self.data is None or self.data.empty:
             raise ValueError("No data available. Please fetch data first.")
-        return self.data['Close'].iloc[-1]
+        return self._close_arr[-1]
     
     def get_price_summary(self) -> Dict[str, float]:
         """Get a summary of current price statistics"""
         if self.data is None or self.data.empty:
             raise ValueError("No data available. Please fetch data first.")
         
+        close = self._close_arr
+        current_price = close[-1]
+        price_change = current_price - close[-2] if len(close) > 1 else 0
+        
         return {
-            'current_price': self.data['Close'].iloc[-1],
-            'high_52w': self.data['High'].max(),
-            'low_52w': self.data['Low'].min(),
-            'avg_volume': self.data['Volume'].mean(),
-            'price_change_1d': self.data['Close'].iloc[-1] - self.data['Close'].iloc[-2] if len(self.data) > 1 else 0,
-            'price_change_pct_1d': ((self.data['Close'].iloc[-1] - self.data['Close'].iloc[-2]) / self.data['Close'].iloc[-2] * 100) if len(self.data) > 1 else 0
+            'current_price': current_price,
+            'high_52w': np.nanmax(self._high_arr),
+            'low_52w': np.nanmin(self._low_arr),
+            'avg_volume': np.nanmean(self._vol_arr),
+            'price_change_1d': price_change,
+            'price_change_pct_1d': (price_change / close[-2] * 100) if len(close) > 1 else 0
         }
     
     def get_trend_analysis(self) -> Dict[str, str]:
@@ -169,14 +316,15 @@ class StockAnalyzer:
             raise ValueError("No data available. Please fetch data first.")
         
         df = self.calculate_technical_indicators()
-        current_price = df['Close'].iloc[-1]
+        latest = df.iloc[-1]
+        current_price = self._close_arr[-1]
         
         # Trend analysis
-        sma_20 = df['SMA_20'].iloc[-1]
-        sma_50 = df['SMA_50'].iloc[-1]
-        ema_12 = df['EMA_12'].iloc[-1]
-        ema_26 = df['EMA_26'].iloc[-1]
-        rsi = df['RSI'].iloc[-1]
+        sma_20 = latest['SMA_20']
+        sma_50 = latest['SMA_50']
+        ema_12 = latest['EMA_12']
+        ema_26 = latest['EMA_26']
+        rsi = latest['RSI']
         
         # Determine trend
         if current_price > sma_20 > sma_50:
@@ -199,8 +347,8 @@ class StockAnalyzer:
             rsi_signal = "Neutral"
         
         # MACD analysis
-        macd = df['MACD'].iloc[-1]
-        macd_signal = df['MACD_Signal'].iloc[-1]
+        macd = latest['MACD']
+        macd_signal = latest['MACD_Signal']
         if macd > macd_signal:
             macd_signal_text = "Bullish"
         else:
@@ -0,0 +1,50 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+# distutils: extra_compile_args = -O3 -march=native
+"""
+Compiled support/resistance extrema scan used by stock_analyzer when available
+
+Build in place (requires Cython and a C compiler):
+    cythonize -i stock_analyzer_ext.pyx
+"""
+
+import numpy as np
+
+
+def find_extrema(const double[::1] low, const double[::1] high, Py_ssize_t window):
+    """
+    Flag bars that are the minimum of `low` / maximum of `high` within
+    `window` bars on each side
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Boolean support and resistance masks
+    """
+    cdef Py_ssize_t n = low.shape[0]
+    cdef Py_ssize_t i, j
+    cdef double value
+    cdef bint ok
+
+    is_support = np.zeros(n, dtype=np.uint8)
+    is_resistance = np.zeros(n, dtype=np.uint8)
+    cdef unsigned char[::1] support = is_support
+    cdef unsigned char[::1] resistance = is_resistance
+
+    with nogil:
+        for i in range(window, n - window):
+            # Comparisons are written so that NaN never qualifies as an extremum
+            value = low[i]
+            ok = True
+            for j in range(1, window + 1):
+                if not (value <= low[i - j] and value <= low[i + j]):
+                    ok = False
+                    break
+            support[i] = ok
+
+            value = high[i]
+            ok = True
+            for j in range(1, window + 1):
+                if not (value >= high[i - j] and value >= high[i + j]):
+                    ok = False
+                    break
+            resistance[i] = ok
+
+    return is_support.view(np.bool_), is_resistance.view(np.bool_)
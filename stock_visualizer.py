@@ -4,18 +4,235 @@ Provides comprehensive charting capabilities for stock analysis with technical i
 """
 
 # type: ignore
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
+from matplotlib.figure import Figure
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional, Tuple
+from typing import BinaryIO, Dict, List, Optional, Tuple, Union
 import warnings
 warnings.filterwarnings('ignore')
 
-# Set style for better-looking charts
-plt.style.use('seaborn-v0_8')
-plt.rcParams['figure.figsize'] = (15, 10)
-plt.rcParams['font.size'] = 10
+try:
+    from numba import njit
+except ImportError:  # numba is optional; long series fall back to min/max bucketing
+    njit = None
+
+_STYLE_APPLIED = False
+
+
+def _ensure_style() -> None:
+    """
+    Apply the chart style on first use rather than at import
+    
+    Importing this module without plotting (e.g. from tooling or an API
+    process that only uses other parts) leaves the caller's rcParams untouched.
+    """
+    global _STYLE_APPLIED
+    if _STYLE_APPLIED:
+        return
+    # Set style for better-looking charts
+    plt.style.use('seaborn-v0_8')
+    plt.rcParams['figure.figsize'] = (15, 10)
+    plt.rcParams['font.size'] = 10
+    _STYLE_APPLIED = True
+
+
+# Default output resolution: PNG is viewed on screen, PDF may be printed
+SCREEN_DPI = 150
+PRINT_DPI = 300
+
+# Encoder settings passed to Pillow. Charts are regenerated on demand, so PNGs
+# favour fast zlib over the last few percent of file size
+PIL_KWARGS = {
+    'png': {'compress_level': 1},
+    'jpg': {'quality': 85, 'optimize': False},
+    'jpeg': {'quality': 85, 'optimize': False},
+}
+
+
+def _save_figure(fig: Figure, save_path: Union[str, os.PathLike, BinaryIO], description: str,
+                 dpi: Optional[int] = None) -> None:
+    """
+    Save a figure to a file path or an in-memory buffer such as io.BytesIO
+    
+    When `dpi` is not given, PDF paths are saved at PRINT_DPI and everything
+    else at SCREEN_DPI; a 300 dpi PNG has 4x the pixels of a 150 dpi one.
+    """
+    # Buffers have no extension and are written in matplotlib's default format
+    if isinstance(save_path, (str, os.PathLike)):
+        save_path = os.fspath(save_path)
+        ext = os.path.splitext(save_path)[1]
+    else:
+        ext = ''
+    fmt = ext[1:].lower() or plt.rcParams['savefig.format']
+    if dpi is None:
+        dpi = PRINT_DPI if fmt == 'pdf' else SCREEN_DPI
+    kwargs = {}
+    if fmt in PIL_KWARGS:
+        # Only the Pillow-backed writers accept pil_kwargs
+        kwargs['pil_kwargs'] = PIL_KWARGS[fmt]
+    fig.savefig(save_path, dpi=dpi, bbox_inches='tight', **kwargs)
+    if not hasattr(save_path, 'write'):
+        print(f"{description} saved to {save_path}")
+
+
+def _show_or_close(fig: Figure, saved: bool, show: Optional[bool] = None) -> None:
+    """
+    Display the figure, or close it to free its canvas
+    
+    By default a figure is shown only when it was not saved, so batch
+    saving doesn't open windows or keep every figure alive in pyplot.
+    """
+    if show is None:
+        show = not saved
+    if show:
+        plt.show()
+    else:
+        plt.close(fig)
+
+
+# Series longer than this are reduced before plotting: about two points per
+# pixel column of a 16-inch figure, so the result looks the same on screen.
+# Lines are reduced with LTTB when numba is installed and with per-bucket
+# min/max otherwise, so the exact points kept (and pixels drawn) for long
+# series differ between installs; both keep the visible shape of the line.
+# Bands and bars use the same NumPy bucketing everywhere.
+DOWNSAMPLE_TARGET = 3200
+
+
+def _bucket_starts(n: int, buckets: int) -> np.ndarray:
+    """Start offsets of `buckets` near-equal buckets over `n` points"""
+    return np.unique(np.linspace(0, n, buckets, endpoint=False).astype(np.int64))
+
+
+def _minmax_indices(y: np.ndarray, target: int) -> np.ndarray:
+    """
+    Sorted indices of each bucket's minimum and maximum, plus both endpoints
+    
+    Keeping both extremes of every bucket preserves the line's envelope at
+    about `target` points. A bucket that is entirely NaN keeps a NaN point,
+    so warm-up periods and gaps still break the line.
+    """
+    n = len(y)
+    starts = _bucket_starts(n, target // 2)
+    bucket = np.repeat(np.arange(len(starts)), np.diff(np.append(starts, n)))
+    nan = np.isnan(y)
+    low = np.where(nan, np.inf, y)
+    high = np.where(nan, -np.inf, y)
+    # First position in each bucket that attains the bucket's min / max
+    is_min = low == np.minimum.reduceat(low, starts)[bucket]
+    is_max = high == np.maximum.reduceat(high, starts)[bucket]
+    first_min = np.flatnonzero(is_min)[np.unique(bucket[is_min], return_index=True)[1]]
+    first_max = np.flatnonzero(is_max)[np.unique(bucket[is_max], return_index=True)[1]]
+    return np.unique(np.concatenate(([0, n - 1], first_min, first_max)))
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _lttb_indices(x: np.ndarray, y: np.ndarray, target: int) -> np.ndarray:
+        """
+        Indices of `target` points chosen by Largest-Triangle-Three-Buckets
+        
+        NaN points are only picked when a whole bucket is NaN, so warm-up
+        periods and gaps still break the line.
+        """
+        n = y.shape[0]
+        every = (n - 2) / (target - 2)
+        indices = np.empty(target, dtype=np.int64)
+        indices[0] = 0
+        indices[target - 1] = n - 1
+        a = 0
+        for i in range(target - 2):
+            start = int(i * every) + 1
+            end = int((i + 1) * every) + 1
+            next_end = min(int((i + 2) * every) + 1, n)
+            
+            # Third triangle vertex: the average of the following bucket
+            avg_x = 0.0
+            avg_y = 0.0
+            count = 0
+            for j in range(end, next_end):
+                if not np.isnan(y[j]):
+                    avg_x += x[j]
+                    avg_y += y[j]
+                    count += 1
+            if count > 0:
+                avg_x /= count
+                avg_y /= count
+            else:
+                avg_x = x[end]
+                avg_y = np.nan
+            
+            # NaN areas never compare greater, so they lose to any real one
+            best = start
+            best_area = -1.0
+            for j in range(start, end):
+                area = abs((x[a] - avg_x) * (y[j] - y[a]) - (x[a] - x[j]) * (avg_y - y[a]))
+                if area > best_area:
+                    best_area = area
+                    best = j
+            indices[i + 1] = best
+            a = best
+        return indices
+else:
+    _lttb_indices = None
+
+
+def _downsample(x: np.ndarray, y: np.ndarray,
+                target: int = DOWNSAMPLE_TARGET) -> Tuple[np.ndarray, np.ndarray]:
+    """Reduce a line series to about `target` points; short series pass through"""
+    if len(y) <= target:
+        return x, y
+    values = np.asarray(y, dtype=np.float64)
+    if _lttb_indices is not None:
+        # x holds matplotlib date numbers, so triangle areas are in day units
+        indices = _lttb_indices(np.asarray(x, dtype=np.float64), values, target)
+    else:
+        indices = _minmax_indices(values, target)
+    return x[indices], y[indices]
+
+
+def _downsample_band(x: np.ndarray, upper: np.ndarray, lower: np.ndarray,
+                     target: int = DOWNSAMPLE_TARGET) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Per-bucket max of `upper` and min of `lower`, keeping a filled band's outline"""
+    if len(x) <= target:
+        return x, upper, lower
+    starts = _bucket_starts(len(x), target)
+    # fmax/fmin skip NaN unless the whole bucket is NaN
+    return x[starts], np.fmax.reduceat(upper, starts), np.fmin.reduceat(lower, starts)
+
+
+def _downsample_bars(x: np.ndarray, y: np.ndarray,
+                     target: int = DOWNSAMPLE_TARGET) -> Tuple[np.ndarray, np.ndarray]:
+    """One bar per bucket, keeping the bucket's largest-magnitude value and its sign"""
+    if len(y) <= target:
+        return x, y
+    starts = _bucket_starts(len(y), target)
+    high = np.fmax.reduceat(y, starts)
+    low = np.fmin.reduceat(y, starts)
+    return x[starts], np.where(np.abs(high) >= np.abs(low), high, low)
+
+
+def _bar_linewidth(ax, x: np.ndarray, bar_x: np.ndarray, width: float = 0.8) -> float:
+    """
+    Line width in points that makes ax.vlines at `bar_x` look like ax.bar with `width`-day bars
+    
+    Bars are sized in data units and lines in points, so the conversion uses
+    the axes' size on the figure and the x-range of the full series `x`, in
+    matplotlib date numbers (days). When `bar_x` is downsampled, each bar
+    stands for a bucket and is `width` of the bucket spacing wide instead.
+    Bars are never thinner than about a pixel.
+    """
+    days = float(x[-1] - x[0])
+    # Buckets tile the plotted range, so their spacing is the range over their count
+    step = days / len(bar_x) if len(bar_x) < len(x) else 1.0
+    days *= 1 + 2 * ax.margins()[0]
+    axes_points = ax.get_position().width * ax.figure.get_figwidth() * 72
+    return max(width * step * axes_points / max(days, 1.0), 72 / ax.figure.dpi)
 
 
 class StockVisualizer:
@@ -33,6 +250,18 @@ class StockVisualizer:
         """
         self.data = data
         self.symbol = symbol
+        
+        # Dates as matplotlib float day numbers, converted once per visualizer
+        # so plotting calls take the plain float path instead of running the
+        # date unit converter on every line. .values keeps a tz-aware index
+        # as datetime64 (in UTC, which is what matplotlib converts to anyway);
+        # .to_pydatetime() would box every date first
+        self._xnum = mdates.date2num(self.data.index.values)
+        self._close = self.data['Close'].to_numpy()
+        self._macd_bars: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+        # Column availability and column arrays, filled lazily by _arrays()
+        self._cols = frozenset(self.data.columns)
+        self._arr: Dict[str, np.ndarray] = {}
         self.colors = {
             'price': '#1f77b4',
             'volume': '#ff7f0e',
@@ -53,390 +282,317 @@ class StockVisualizer:
             'stoch_d': '#ff7f0e'
         }
     
+    def _arrays(self, *names: str) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """
+        Date numbers and the cached column arrays, after loading the requested columns
+        
+        Plotting raw float arrays skips matplotlib's per-call unit conversion.
+        Each column is extracted once per visualizer; columns missing from the
+        data are skipped, so check availability against self._cols.
+        """
+        for name in names:
+            if name in self._cols and name not in self._arr:
+                self._arr[name] = self.data[name].to_numpy()
+        return self._xnum, self._arr
+    
+    def _apply_date_axis(self, ax, interval: int) -> None:
+        """Date labels every `interval` months, rotated 45 degrees"""
+        # x data are plain float day numbers, so mark the axis as dates
+        ax.xaxis_date()
+        # Each axis gets its own formatter and locator; they hold a reference
+        # to their axis and must not be shared
+        ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
+        ax.xaxis.set_major_locator(mdates.MonthLocator(interval=interval))
+        # Rotation is set on the axis, not on tick Text objects created early
+        ax.tick_params(axis='x', labelrotation=45)
+    
+    def _macd_histogram(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """MACD histogram bar dates, heights and colors, computed once per visualizer"""
+        if self._macd_bars is None:
+            bar_dates, hist = _downsample_bars(self._xnum, self.data['MACD_Hist'].to_numpy())
+            # Bar colors picked in one vectorized pass
+            self._macd_bars = bar_dates, hist, np.where(hist >= 0, 'green', 'red')
+        return self._macd_bars
+    
     def plot_comprehensive_chart(self, support_levels: List[float] = None, 
                                 resistance_levels: List[float] = None,
-                                save_path: Optional[str] = None) -> None:
+                                save_path: Optional[Union[str, BinaryIO]] = None,
+                                dpi: Optional[int] = None,
+                                show: Optional[bool] = None) -> Figure:
         """
         Create a comprehensive chart with price, volume, and technical indicators
         
         Args:
             support_levels (List[float]): List of support levels to plot
             resistance_levels (List[float]): List of resistance levels to plot
-            save_path (Optional[str]): Path to save the chart image
+            save_path (Optional[Union[str, BinaryIO]]): Path or binary file object to save the chart image
+            dpi (Optional[int]): Resolution of the saved image (default: 150, or 300 for PDF)
+            show (Optional[bool]): Whether to display the chart; by default only when not saved
+            
+        Returns:
+            Figure: The figure that was drawn
         """
-        fig, axes = plt.subplots(4, 1, figsize=(16, 12), 
-                                gridspec_kw={'height_ratios': [3, 1, 1, 1]})
+        # Indicator panels are only created when their data is present
+        has_macd = self._cols.issuperset(['MACD', 'MACD_Signal', 'MACD_Hist'])
+        has_rsi = 'RSI' in self._cols
+        n_rows = 2 + has_macd + has_rsi
+        
+        _ensure_style()
+        fig, axes = plt.subplots(n_rows, 1, figsize=(16, 12), 
+                                gridspec_kw={'height_ratios': [3] + [1] * (n_rows - 1)})
         
         # Main price chart
-        self._plot_price_chart(axes[0], support_levels, resistance_levels)
+        self._render_price(axes[0], support_levels, resistance_levels, standalone=False)
         
         # Volume chart
-        self._plot_volume_chart(axes[1])
+        self._render_volume(axes[1], standalone=False)
+        
+        row = 2
         
         # MACD chart
-        self._plot_macd_chart(axes[2])
+        if has_macd:
+            self._render_macd(axes[row], standalone=False)
+            row += 1
         
         # RSI chart
-        self._plot_rsi_chart(axes[3])
+        if has_rsi:
+            self._render_rsi(axes[row], standalone=False)
         
-        plt.tight_layout()
+        return self._finalize(fig, save_path, 'Chart', dpi, show)
+    
+    def _finalize(self, fig: Figure, save_path: Optional[Union[str, BinaryIO]],
+                  description: str, dpi: Optional[int] = None,
+                  show: Optional[bool] = None) -> Figure:
+        """Lay out the figure, save it if requested and show or close it"""
+        fig.tight_layout()
         
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-            print(f"Chart saved to {save_path}")
+            _save_figure(fig, save_path, description, dpi=dpi)
         
-        plt.show()
+        _show_or_close(fig, bool(save_path), show)
+        return fig
     
-    def _plot_price_chart(self, ax, support_levels: List[float] = None, 
-                          resistance_levels: List[float] = None) -> None:
-        """Plot the main price chart with indicators"""
-        # Plot candlestick-like data (using OHLC)
-        dates = self.data.index
-        
-        # Plot price line
-        ax.plot(dates, self.data['Close'], color=self.colors['price'], 
-                linewidth=1.5, label='Close Price', alpha=0.8)
-        
-        # Plot moving averages
-        if 'SMA_20' in self.data.columns:
-            ax.plot(dates, self.data['SMA_20'], color=self.colors['sma_20'], 
-                    linewidth=1, label='SMA 20', alpha=0.7)
-        
-        if 'SMA_50' in self.data.columns:
-            ax.plot(dates, self.data['SMA_50'], color=self.colors['sma_50'], 
-                    linewidth=1, label='SMA 50', alpha=0.7)
-        
-        # Plot Bollinger Bands
-        if all(col in self.data.columns for col in ['BB_Upper', 'BB_Middle', 'BB_Lower']):
-            ax.plot(dates, self.data['BB_Upper'], color=self.colors['bb_upper'], 
-                    linewidth=0.8, label='BB Upper', alpha=0.6, linestyle='--')
-            ax.plot(dates, self.data['BB_Middle'], color=self.colors['bb_middle'], 
-                    linewidth=0.8, label='BB Middle', alpha=0.6, linestyle='--')
-            ax.plot(dates, self.data['BB_Lower'], color=self.colors['bb_lower'], 
-                    linewidth=0.8, label='BB Lower', alpha=0.6, linestyle='--')
-            
-            # Fill Bollinger Bands
-            ax.fill_between(dates, self.data['BB_Upper'], self.data['BB_Lower'], 
-                           alpha=0.1, color=self.colors['bb_upper'])
-        
-        # Plot support and resistance levels
-        if support_levels:
-            for level in support_levels:
-                ax.axhline(y=level, color=self.colors['support'], linestyle='-', 
-                          alpha=0.7, linewidth=1, label='Support' if level == support_levels[0] else "")
-        
-        if resistance_levels:
-            for level in resistance_levels:
-                ax.axhline(y=level, color=self.colors['resistance'], linestyle='-', 
-                          alpha=0.7, linewidth=1, label='Resistance' if level == resistance_levels[0] else "")
-        
-        ax.set_title(f'{self.symbol} Stock Analysis - Price Chart', fontsize=14, fontweight='bold')
-        ax.set_ylabel('Price ($)', fontsize=12)
-        ax.legend(loc='upper left', fontsize=10)
+    def _standalone_axes(self):
+        """Figure and axes for a single-panel chart"""
+        _ensure_style()
+        return plt.subplots(figsize=(15, 8))
+    
+    def _finish_axes(self, ax, title: str, ylabel: str, standalone: bool,
+                     legend: bool = True) -> None:
+        """Title, labels, legend, grid and date axis shared by every panel"""
+        # Standalone charts get larger text, an x label and monthly ticks;
+        # panels of the comprehensive chart are more compact
+        ax.set_title(title, fontsize=16 if standalone else 12, fontweight='bold')
+        ax.set_ylabel(ylabel, fontsize=12 if standalone else 10)
+        if standalone:
+            ax.set_xlabel('Date', fontsize=12)
+        if legend:
+            ax.legend(loc='upper left', fontsize=10 if standalone else 8)
         ax.grid(True, alpha=0.3)
         
         # Format x-axis
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
-        ax.xaxis.set_major_locator(mdates.MonthLocator(interval=2))
-        plt.setp(ax.xaxis.get_majorticklabels(), rotation=45)
+        self._apply_date_axis(ax, interval=1 if standalone else 2)
     
-    def plot_price_chart(self, support_levels: List[float] = None, 
-                        resistance_levels: List[float] = None,
-                        save_path: Optional[str] = None) -> None:
-        """Plot standalone price chart with indicators"""
-        fig, ax = plt.subplots(figsize=(15, 8))
+    def _render_price(self, ax, support_levels: List[float] = None, 
+                      resistance_levels: List[float] = None, *,
+                      standalone: bool) -> None:
+        """Plot the price chart with moving averages, Bollinger Bands and levels"""
+        dates, arr = self._arrays('Close', 'SMA_20', 'SMA_50', 'BB_Upper', 'BB_Middle', 'BB_Lower')
         
         # Plot price line
-        dates = self.data.index
-        ax.plot(dates, self.data['Close'], color=self.colors['price'], 
-                linewidth=2, label='Close Price')
+        ax.plot(*_downsample(dates, arr['Close']), color=self.colors['price'], 
+                linewidth=2 if standalone else 1.5, label='Close Price',
+                alpha=None if standalone else 0.8)
         
         # Plot moving averages
-        if 'SMA_20' in self.data.columns:
-            ax.plot(dates, self.data['SMA_20'], color=self.colors['sma_20'], 
-                    linewidth=1.5, label='SMA 20')
+        sma_width, sma_alpha = (1.5, None) if standalone else (1, 0.7)
+        if 'SMA_20' in self._cols:
+            ax.plot(*_downsample(dates, arr['SMA_20']), color=self.colors['sma_20'], 
+                    linewidth=sma_width, label='SMA 20', alpha=sma_alpha)
         
-        if 'SMA_50' in self.data.columns:
-            ax.plot(dates, self.data['SMA_50'], color=self.colors['sma_50'], 
-                    linewidth=1.5, label='SMA 50')
+        if 'SMA_50' in self._cols:
+            ax.plot(*_downsample(dates, arr['SMA_50']), color=self.colors['sma_50'], 
+                    linewidth=sma_width, label='SMA 50', alpha=sma_alpha)
         
         # Plot Bollinger Bands
-        if all(col in self.data.columns for col in ['BB_Upper', 'BB_Middle', 'BB_Lower']):
-            ax.plot(dates, self.data['BB_Upper'], color=self.colors['bb_upper'], 
-                    linewidth=1, label='BB Upper', linestyle='--', alpha=0.7)
-            ax.plot(dates, self.data['BB_Middle'], color=self.colors['bb_middle'], 
-                    linewidth=1, label='BB Middle', linestyle='--', alpha=0.7)
-            ax.plot(dates, self.data['BB_Lower'], color=self.colors['bb_lower'], 
-                    linewidth=1, label='BB Lower', linestyle='--', alpha=0.7)
+        if self._cols.issuperset(['BB_Upper', 'BB_Middle', 'BB_Lower']):
+            bb_width, bb_alpha = (1, 0.7) if standalone else (0.8, 0.6)
+            ax.plot(*_downsample(dates, arr['BB_Upper']), color=self.colors['bb_upper'], 
+                    linewidth=bb_width, label='BB Upper', alpha=bb_alpha, linestyle='--')
+            ax.plot(*_downsample(dates, arr['BB_Middle']), color=self.colors['bb_middle'], 
+                    linewidth=bb_width, label='BB Middle', alpha=bb_alpha, linestyle='--')
+            ax.plot(*_downsample(dates, arr['BB_Lower']), color=self.colors['bb_lower'], 
+                    linewidth=bb_width, label='BB Lower', alpha=bb_alpha, linestyle='--')
             
             # Fill Bollinger Bands
-            ax.fill_between(dates, self.data['BB_Upper'], self.data['BB_Lower'], 
+            ax.fill_between(*_downsample_band(dates, arr['BB_Upper'], arr['BB_Lower']), 
                            alpha=0.1, color=self.colors['bb_upper'])
         
         # Plot support and resistance levels
+        # One LineCollection per group; the y-axis transform spans the full
+        # width like axhline while x is in axes coordinates
+        level_width, level_alpha = (2, 0.8) if standalone else (1, 0.7)
         if support_levels:
-            for level in support_levels:
-                ax.axhline(y=level, color=self.colors['support'], linestyle='-', 
-                          alpha=0.8, linewidth=2, label='Support' if level == support_levels[0] else "")
+            ax.hlines(support_levels, 0, 1, transform=ax.get_yaxis_transform(),
+                      colors=self.colors['support'], linestyle='-',
+                      alpha=level_alpha, linewidth=level_width, label='Support')
         
         if resistance_levels:
-            for level in resistance_levels:
-                ax.axhline(y=level, color=self.colors['resistance'], linestyle='-', 
-                          alpha=0.8, linewidth=2, label='Resistance' if level == resistance_levels[0] else "")
-        
-        ax.set_title(f'{self.symbol} - Price Chart with Indicators', fontsize=16, fontweight='bold')
+            ax.hlines(resistance_levels, 0, 1, transform=ax.get_yaxis_transform(),
+                      colors=self.colors['resistance'], linestyle='-',
+                      alpha=level_alpha, linewidth=level_width, label='Resistance')
+        
+        if standalone:
+            ax.set_title(f'{self.symbol} - Price Chart with Indicators', fontsize=16, fontweight='bold')
+            ax.set_xlabel('Date', fontsize=12)
+        else:
+            ax.set_title(f'{self.symbol} Stock Analysis - Price Chart', fontsize=14, fontweight='bold')
         ax.set_ylabel('Price ($)', fontsize=12)
-        ax.set_xlabel('Date', fontsize=12)
         ax.legend(loc='upper left', fontsize=10)
         ax.grid(True, alpha=0.3)
         
         # Format x-axis
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
-        ax.xaxis.set_major_locator(mdates.MonthLocator(interval=1))
-        plt.setp(ax.xaxis.get_majorticklabels(), rotation=45)
-        
-        plt.tight_layout()
-        
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-            print(f"Price chart saved to {save_path}")
-        
-        plt.show()
+        self._apply_date_axis(ax, interval=1 if standalone else 2)
     
-    def _plot_volume_chart(self, ax) -> None:
-        """Plot volume chart"""
-        dates = self.data.index
-        
-        # Plot volume bars
-        ax.bar(dates, self.data['Volume'], color=self.colors['volume'], 
-               alpha=0.7, width=0.8)
-        
-        ax.set_title('Volume', fontsize=12, fontweight='bold')
-        ax.set_ylabel('Volume', fontsize=10)
-        ax.grid(True, alpha=0.3)
-        
-        # Format x-axis
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
-        ax.xaxis.set_major_locator(mdates.MonthLocator(interval=2))
-        plt.setp(ax.xaxis.get_majorticklabels(), rotation=45)
+    def plot_price_chart(self, support_levels: List[float] = None, 
+                        resistance_levels: List[float] = None,
+                        save_path: Optional[Union[str, BinaryIO]] = None,
+                        dpi: Optional[int] = None,
+                        show: Optional[bool] = None) -> Figure:
+        """Plot standalone price chart with indicators"""
+        fig, ax = self._standalone_axes()
+        self._render_price(ax, support_levels, resistance_levels, standalone=True)
+        return self._finalize(fig, save_path, 'Price chart', dpi, show)
+    
+    def _render_volume(self, ax, *, standalone: bool) -> None:
+        """Plot volume bars"""
+        dates, arr = self._arrays('Volume')
+        
+        # Plot volume bars as one LineCollection rather than a Rectangle per day
+        bar_dates, volume = _downsample_bars(dates, arr['Volume'])
+        ax.vlines(bar_dates, 0, volume, colors=self.colors['volume'], alpha=0.7,
+                  linewidth=_bar_linewidth(ax, dates, bar_dates), capstyle='butt', rasterized=True)
+        ax.set_ylim(bottom=0)
+        
+        title = f'{self.symbol} - Volume Chart' if standalone else 'Volume'
+        self._finish_axes(ax, title, 'Volume', standalone, legend=False)
     
-    def plot_volume_chart(self, save_path: Optional[str] = None) -> None:
+    def plot_volume_chart(self, save_path: Optional[Union[str, BinaryIO]] = None,
+                          dpi: Optional[int] = None,
+                          show: Optional[bool] = None) -> Figure:
         """Plot standalone volume chart"""
-        fig, ax = plt.subplots(figsize=(15, 8))
-        
-        dates = self.data.index
-        
-        # Plot volume bars
-        ax.bar(dates, self.data['Volume'], color=self.colors['volume'], 
-               alpha=0.7, width=0.8)
-        
-        ax.set_title(f'{self.symbol} - Volume Chart', fontsize=16, fontweight='bold')
-        ax.set_ylabel('Volume', fontsize=12)
-        ax.set_xlabel('Date', fontsize=12)
-        ax.grid(True, alpha=0.3)
-        
-        # Format x-axis
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
-        ax.xaxis.set_major_locator(mdates.MonthLocator(interval=1))
-        plt.setp(ax.xaxis.get_majorticklabels(), rotation=45)
-        
-        plt.tight_layout()
-        
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-            print(f"Volume chart saved to {save_path}")
-        
-        plt.show()
+        fig, ax = self._standalone_axes()
+        self._render_volume(ax, standalone=True)
+        return self._finalize(fig, save_path, 'Volume chart', dpi, show)
     
-    def _plot_macd_chart(self, ax) -> None:
-        """Plot MACD chart"""
-        if not all(col in self.data.columns for col in ['MACD', 'MACD_Signal', 'MACD_Hist']):
+    def _render_macd(self, ax, *, standalone: bool) -> None:
+        """Plot MACD and signal lines over the histogram"""
+        title = f'{self.symbol} - MACD Chart' if standalone else 'MACD'
+        dates, arr = self._arrays('MACD', 'MACD_Signal', 'MACD_Hist')
+        if not self._cols.issuperset(['MACD', 'MACD_Signal', 'MACD_Hist']):
             ax.text(0.5, 0.5, 'MACD data not available', ha='center', va='center', 
-                   transform=ax.transAxes)
+                   transform=ax.transAxes, fontsize=14 if standalone else None)
+            if standalone:
+                ax.set_title(title, fontsize=16, fontweight='bold')
             return
         
-        dates = self.data.index
-        
         # Plot MACD lines
-        ax.plot(dates, self.data['MACD'], color=self.colors['macd'], 
-                linewidth=1, label='MACD')
-        ax.plot(dates, self.data['MACD_Signal'], color=self.colors['macd_signal'], 
-                linewidth=1, label='Signal')
+        line_width = 2 if standalone else 1
+        ax.plot(*_downsample(dates, arr['MACD']), color=self.colors['macd'], 
+                linewidth=line_width, label='MACD')
+        ax.plot(*_downsample(dates, arr['MACD_Signal']), color=self.colors['macd_signal'], 
+                linewidth=line_width, label='Signal')
         
         # Plot MACD histogram
-        colors = ['green' if x >= 0 else 'red' for x in self.data['MACD_Hist']]
-        ax.bar(dates, self.data['MACD_Hist'], color=colors, alpha=0.6, width=0.8)
+        bar_dates, hist, colors = self._macd_histogram()
+        ax.vlines(bar_dates, 0, hist, colors=colors, alpha=0.6,
+                  linewidth=_bar_linewidth(ax, dates, bar_dates), capstyle='butt', rasterized=True)
         
         # Add zero line
         ax.axhline(y=0, color='black', linestyle='-', alpha=0.5, linewidth=0.5)
         
-        ax.set_title('MACD', fontsize=12, fontweight='bold')
-        ax.set_ylabel('MACD', fontsize=10)
-        ax.legend(loc='upper left', fontsize=8)
-        ax.grid(True, alpha=0.3)
-        
-        # Format x-axis
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
-        ax.xaxis.set_major_locator(mdates.MonthLocator(interval=2))
-        plt.setp(ax.xaxis.get_majorticklabels(), rotation=45)
+        self._finish_axes(ax, title, 'MACD', standalone)
     
-    def plot_macd_chart(self, save_path: Optional[str] = None) -> None:
+    def plot_macd_chart(self, save_path: Optional[Union[str, BinaryIO]] = None,
+                        dpi: Optional[int] = None,
+                        show: Optional[bool] = None) -> Figure:
         """Plot standalone MACD chart"""
-        fig, ax = plt.subplots(figsize=(15, 8))
-        
-        if not all(col in self.data.columns for col in ['MACD', 'MACD_Signal', 'MACD_Hist']):
-            ax.text(0.5, 0.5, 'MACD data not available', ha='center', va='center', 
-                   transform=ax.transAxes, fontsize=14)
-            ax.set_title(f'{self.symbol} - MACD Chart', fontsize=16, fontweight='bold')
-            plt.tight_layout()
-            if save_path:
-                plt.savefig(save_path, dpi=300, bbox_inches='tight')
-                print(f"MACD chart saved to {save_path}")
-            plt.show()
-            return
-        
-        dates = self.data.index
-        
-        # Plot MACD lines
-        ax.plot(dates, self.data['MACD'], color=self.colors['macd'], 
-                linewidth=2, label='MACD')
-        ax.plot(dates, self.data['MACD_Signal'], color=self.colors['macd_signal'], 
-                linewidth=2, label='Signal')
-        
-        # Plot MACD histogram
-        colors = ['green' if x >= 0 else 'red' for x in self.data['MACD_Hist']]
-        ax.bar(dates, self.data['MACD_Hist'], color=colors, alpha=0.6, width=0.8)
-        
-        # Add zero line
-        ax.axhline(y=0, color='black', linestyle='-', alpha=0.5, linewidth=0.5)
-        
-        ax.set_title(f'{self.symbol} - MACD Chart', fontsize=16, fontweight='bold')
-        ax.set_ylabel('MACD', fontsize=12)
-        ax.set_xlabel('Date', fontsize=12)
-        ax.legend(loc='upper left', fontsize=10)
-        ax.grid(True, alpha=0.3)
-        
-        # Format x-axis
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
-        ax.xaxis.set_major_locator(mdates.MonthLocator(interval=1))
-        plt.setp(ax.xaxis.get_majorticklabels(), rotation=45)
-        
-        plt.tight_layout()
-        
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-            print(f"MACD chart saved to {save_path}")
-        
-        plt.show()
+        fig, ax = self._standalone_axes()
+        self._render_macd(ax, standalone=True)
+        return self._finalize(fig, save_path, 'MACD chart', dpi, show)
     
-    def _plot_rsi_chart(self, ax) -> None:
-        """Plot RSI chart"""
-        if 'RSI' not in self.data.columns:
+    def _render_rsi(self, ax, *, standalone: bool) -> None:
+        """Plot RSI with overbought and oversold thresholds"""
+        title = f'{self.symbol} - RSI Chart' if standalone else 'RSI (14)'
+        dates, arr = self._arrays('RSI')
+        if 'RSI' not in self._cols:
             ax.text(0.5, 0.5, 'RSI data not available', ha='center', va='center', 
-                   transform=ax.transAxes)
+                   transform=ax.transAxes, fontsize=14 if standalone else None)
+            if standalone:
+                ax.set_title(title, fontsize=16, fontweight='bold')
             return
         
-        dates = self.data.index
-        
         # Plot RSI line
-        ax.plot(dates, self.data['RSI'], color=self.colors['rsi'], 
-                linewidth=1.5, label='RSI')
+        ax.plot(*_downsample(dates, arr['RSI']), color=self.colors['rsi'], 
+                linewidth=2 if standalone else 1.5, label='RSI')
         
         # Add overbought and oversold lines
-        ax.axhline(y=70, color='red', linestyle='--', alpha=0.7, linewidth=1, label='Overbought')
-        ax.axhline(y=30, color='green', linestyle='--', alpha=0.7, linewidth=1, label='Oversold')
-        ax.axhline(y=50, color='gray', linestyle='-', alpha=0.5, linewidth=0.5)
+        band_width = 2 if standalone else 1
+        ax.axhline(y=70, color='red', linestyle='--', alpha=0.7, linewidth=band_width, label='Overbought')
+        ax.axhline(y=30, color='green', linestyle='--', alpha=0.7, linewidth=band_width, label='Oversold')
+        ax.axhline(y=50, color='gray', linestyle='-', alpha=0.5, linewidth=band_width / 2)
         
-        ax.set_title('RSI (14)', fontsize=12, fontweight='bold')
-        ax.set_ylabel('RSI', fontsize=10)
         ax.set_ylim(0, 100)
-        ax.legend(loc='upper left', fontsize=8)
-        ax.grid(True, alpha=0.3)
-        
-        # Format x-axis
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
-        ax.xaxis.set_major_locator(mdates.MonthLocator(interval=2))
-        plt.setp(ax.xaxis.get_majorticklabels(), rotation=45)
+        self._finish_axes(ax, title, 'RSI', standalone)
     
-    def plot_rsi_chart(self, save_path: Optional[str] = None) -> None:
+    def plot_rsi_chart(self, save_path: Optional[Union[str, BinaryIO]] = None,
+                       dpi: Optional[int] = None,
+                       show: Optional[bool] = None) -> Figure:
         """Plot standalone RSI chart"""
-        fig, ax = plt.subplots(figsize=(15, 8))
-        
-        if 'RSI' not in self.data.columns:
-            ax.text(0.5, 0.5, 'RSI data not available', ha='center', va='center', 
-                   transform=ax.transAxes, fontsize=14)
-            ax.set_title(f'{self.symbol} - RSI Chart', fontsize=16, fontweight='bold')
-            plt.tight_layout()
-            if save_path:
-                plt.savefig(save_path, dpi=300, bbox_inches='tight')
-                print(f"RSI chart saved to {save_path}")
-            plt.show()
-            return
-        
-        dates = self.data.index
-        
-        # Plot RSI line
-        ax.plot(dates, self.data['RSI'], color=self.colors['rsi'], 
-                linewidth=2, label='RSI')
-        
-        # Add overbought and oversold lines
-        ax.axhline(y=70, color='red', linestyle='--', alpha=0.7, linewidth=2, label='Overbought')
-        ax.axhline(y=30, color='green', linestyle='--', alpha=0.7, linewidth=2, label='Oversold')
-        ax.axhline(y=50, color='gray', linestyle='-', alpha=0.5, linewidth=1)
-        
-        ax.set_title(f'{self.symbol} - RSI Chart', fontsize=16, fontweight='bold')
-        ax.set_ylabel('RSI', fontsize=12)
-        ax.set_xlabel('Date', fontsize=12)
-        ax.set_ylim(0, 100)
-        ax.legend(loc='upper left', fontsize=10)
-        ax.grid(True, alpha=0.3)
-        
-        # Format x-axis
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
-        ax.xaxis.set_major_locator(mdates.MonthLocator(interval=1))
-        plt.setp(ax.xaxis.get_majorticklabels(), rotation=45)
-        
-        plt.tight_layout()
-        
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-            print(f"RSI chart saved to {save_path}")
-        
-        plt.show()
+        fig, ax = self._standalone_axes()
+        self._render_rsi(ax, standalone=True)
+        return self._finalize(fig, save_path, 'RSI chart', dpi, show)
     
     def plot_support_resistance_chart(self, support_levels: List[float],
                                     resistance_levels: List[float],
-                                    save_path: Optional[str] = None) -> None:
+                                    save_path: Optional[Union[str, BinaryIO]] = None,
+                                    dpi: Optional[int] = None,
+                                    show: Optional[bool] = None) -> Figure:
         """
         Create a focused chart showing support and resistance levels
         
         Args:
             support_levels (List[float]): List of support levels
             resistance_levels (List[float]): List of resistance levels
-            save_path (Optional[str]): Path to save the chart image
+            save_path (Optional[Union[str, BinaryIO]]): Path or binary file object to save the chart image
+            dpi (Optional[int]): Resolution of the saved image (default: 150, or 300 for PDF)
+            show (Optional[bool]): Whether to display the chart; by default only when not saved
+            
+        Returns:
+            Figure: The figure that was drawn
         """
-        fig, ax = plt.subplots(figsize=(15, 8))
+        fig, ax = self._standalone_axes()
         
-        dates = self.data.index
+        dates, arr = self._arrays('Close')
         
         # Plot price
-        ax.plot(dates, self.data['Close'], color=self.colors['price'], 
+        ax.plot(*_downsample(dates, arr['Close']), color=self.colors['price'], 
                 linewidth=2, label='Close Price')
         
-        # Plot support levels
-        for i, level in enumerate(support_levels):
-            ax.axhline(y=level, color=self.colors['support'], linestyle='-', 
-                      alpha=0.8, linewidth=2, 
-                      label=f'Support ${level:.2f}' if i == 0 else "")
+        # Plot support levels (labelled by the first one, as before)
+        if support_levels:
+            ax.hlines(support_levels, 0, 1, transform=ax.get_yaxis_transform(),
+                      colors=self.colors['support'], linestyle='-',
+                      alpha=0.8, linewidth=2, label=f'Support ${support_levels[0]:.2f}')
         
         # Plot resistance levels
-        for i, level in enumerate(resistance_levels):
-            ax.axhline(y=level, color=self.colors['resistance'], linestyle='-', 
-                      alpha=0.8, linewidth=2, 
-                      label=f'Resistance ${level:.2f}' if i == 0 else "")
+        if resistance_levels:
+            ax.hlines(resistance_levels, 0, 1, transform=ax.get_yaxis_transform(),
+                      colors=self.colors['resistance'], linestyle='-',
+                      alpha=0.8, linewidth=2, label=f'Resistance ${resistance_levels[0]:.2f}')
         
         # Add current price annotation
-        current_price = self.data['Close'].iloc[-1]
+        current_price = self._close[-1]
         ax.axhline(y=current_price, color='orange', linestyle='--', 
                   alpha=0.8, linewidth=2, label=f'Current Price ${current_price:.2f}')
         
@@ -448,48 +604,47 @@ class StockVisualizer:
         ax.grid(True, alpha=0.3)
         
         # Format x-axis
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
-        ax.xaxis.set_major_locator(mdates.MonthLocator(interval=1))
-        plt.setp(ax.xaxis.get_majorticklabels(), rotation=45)
-        
-        plt.tight_layout()
+        self._apply_date_axis(ax, interval=1)
         
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-            print(f"Support/Resistance chart saved to {save_path}")
-        
-        plt.show()
+        return self._finalize(fig, save_path, 'Support/Resistance chart', dpi, show)
     
-    def plot_trend_analysis(self, save_path: Optional[str] = None) -> None:
+    def plot_trend_analysis(self, save_path: Optional[Union[str, BinaryIO]] = None,
+                            dpi: Optional[int] = None,
+                            show: Optional[bool] = None) -> Figure:
         """
         Create a chart focusing on trend analysis with moving averages
         
         Args:
-            save_path (Optional[str]): Path to save the chart image
+            save_path (Optional[Union[str, BinaryIO]]): Path or binary file object to save the chart image
+            dpi (Optional[int]): Resolution of the saved image (default: 150, or 300 for PDF)
+            show (Optional[bool]): Whether to display the chart; by default only when not saved
+            
+        Returns:
+            Figure: The figure that was drawn
         """
-        fig, ax = plt.subplots(figsize=(15, 8))
+        fig, ax = self._standalone_axes()
         
-        dates = self.data.index
+        dates, arr = self._arrays('Close', 'SMA_20', 'SMA_50', 'EMA_12', 'EMA_26')
         
         # Plot price
-        ax.plot(dates, self.data['Close'], color=self.colors['price'], 
+        ax.plot(*_downsample(dates, arr['Close']), color=self.colors['price'], 
                 linewidth=2, label='Close Price')
         
         # Plot moving averages
-        if 'SMA_20' in self.data.columns:
-            ax.plot(dates, self.data['SMA_20'], color=self.colors['sma_20'], 
+        if 'SMA_20' in self._cols:
+            ax.plot(*_downsample(dates, arr['SMA_20']), color=self.colors['sma_20'], 
                     linewidth=2, label='SMA 20')
         
-        if 'SMA_50' in self.data.columns:
-            ax.plot(dates, self.data['SMA_50'], color=self.colors['sma_50'], 
+        if 'SMA_50' in self._cols:
+            ax.plot(*_downsample(dates, arr['SMA_50']), color=self.colors['sma_50'], 
                     linewidth=2, label='SMA 50')
         
-        if 'EMA_12' in self.data.columns:
-            ax.plot(dates, self.data['EMA_12'], color=self.colors['ema_12'], 
+        if 'EMA_12' in self._cols:
+            ax.plot(*_downsample(dates, arr['EMA_12']), color=self.colors['ema_12'], 
                     linewidth=1.5, label='EMA 12', alpha=0.8)
         
-        if 'EMA_26' in self.data.columns:
-            ax.plot(dates, self.data['EMA_26'], color=self.colors['ema_26'], 
+        if 'EMA_26' in self._cols:
+            ax.plot(*_downsample(dates, arr['EMA_26']), color=self.colors['ema_26'], 
                     linewidth=1.5, label='EMA 26', alpha=0.8)
         
         ax.set_title(f'{self.symbol} - Trend Analysis', fontsize=16, fontweight='bold')
@@ -499,17 +654,32 @@ class StockVisualizer:
         ax.grid(True, alpha=0.3)
         
         # Format x-axis
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
-        ax.xaxis.set_major_locator(mdates.MonthLocator(interval=1))
-        plt.setp(ax.xaxis.get_majorticklabels(), rotation=45)
-        
-        plt.tight_layout()
+        self._apply_date_axis(ax, interval=1)
         
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-            print(f"Trend analysis chart saved to {save_path}")
-        
-        plt.show()
+        return self._finalize(fig, save_path, 'Trend analysis chart', dpi, show)
+
+
+def _render_comprehensive(data: pd.DataFrame, symbol: str, levels: Dict[str, List[float]], path: str) -> None:
+    """Save the comprehensive chart; module-level so it can run in a worker process"""
+    StockVisualizer(data, symbol).plot_comprehensive_chart(
+        support_levels=levels['support'],
+        resistance_levels=levels['resistance'],
+        save_path=path
+    )
+
+
+def _render_support_resistance(data: pd.DataFrame, symbol: str, levels: Dict[str, List[float]], path: str) -> None:
+    """Save the support/resistance chart; module-level so it can run in a worker process"""
+    StockVisualizer(data, symbol).plot_support_resistance_chart(
+        support_levels=levels['support'],
+        resistance_levels=levels['resistance'],
+        save_path=path
+    )
+
+
+def _render_trend(data: pd.DataFrame, symbol: str, levels: Dict[str, List[float]], path: str) -> None:
+    """Save the trend analysis chart; module-level so it can run in a worker process"""
+    StockVisualizer(data, symbol).plot_trend_analysis(save_path=path)
 
 
 def create_stock_charts(analyzer, data_with_indicators, levels, 
@@ -517,6 +687,10 @@ def create_stock_charts(analyzer, data_with_indicators, levels,
     """
     Convenience function to create all stock charts
     
+    When saving on a multi-core machine, the three charts are rendered in
+    parallel worker processes; otherwise each chart is written by a
+    background thread while the next one is drawn.
+    
     Args:
         analyzer: StockAnalyzer object
         data_with_indicators: DataFrame with technical indicators
@@ -524,33 +698,83 @@ def create_stock_charts(analyzer, data_with_indicators, levels,
         save_charts (bool): Whether to save charts to files
         output_dir (str): Directory to save charts
     """
-    import os
-    
     if save_charts and not os.path.exists(output_dir):
         os.makedirs(output_dir)
     
-    visualizer = StockVisualizer(data_with_indicators, analyzer.symbol)
+    symbol = analyzer.symbol
     
-    # Create comprehensive chart
-    comprehensive_path = os.path.join(output_dir, f"{analyzer.symbol}_comprehensive.png") if save_charts else None
-    visualizer.plot_comprehensive_chart(
-        support_levels=levels['support'],
-        resistance_levels=levels['resistance'],
-        save_path=comprehensive_path
-    )
+    # Read the start method without fixing it process-wide (allow_none), and
+    # pass an explicit context to the pool below for the same reason; otherwise
+    # a caller's later multiprocessing.set_start_method() would fail
+    start_method = (multiprocessing.get_start_method(allow_none=True)
+                    or multiprocessing.get_all_start_methods()[0])
     
-    # Create support/resistance chart
-    sr_path = os.path.join(output_dir, f"{analyzer.symbol}_support_resistance.png") if save_charts else None
-    visualizer.plot_support_resistance_chart(
-        support_levels=levels['support'],
-        resistance_levels=levels['resistance'],
-        save_path=sr_path
-    )
+    # Saved charts are independent figures, so workers can render them
+    # side by side. Only forked workers pay off: spawned ones re-import
+    # pandas and matplotlib, which takes longer than the charts themselves
+    if save_charts and (os.cpu_count() or 1) > 1 and start_method == 'fork':
+        jobs = [
+            (_render_comprehensive, os.path.join(output_dir, f"{symbol}_comprehensive.png")),
+            (_render_support_resistance, os.path.join(output_dir, f"{symbol}_support_resistance.png")),
+            (_render_trend, os.path.join(output_dir, f"{symbol}_trend_analysis.png")),
+        ]
+        # Workers only write files; Agg avoids touching the parent's GUI backend
+        with ProcessPoolExecutor(max_workers=len(jobs),
+                                 mp_context=multiprocessing.get_context(start_method),
+                                 initializer=plt.switch_backend, initargs=('Agg',)) as pool:
+            futures = [pool.submit(render, data_with_indicators, symbol, levels, path)
+                       for render, path in jobs]
+            for future in futures:
+                future.result()
+        return
     
-    # Create trend analysis chart
-    trend_path = os.path.join(output_dir, f"{analyzer.symbol}_trend_analysis.png") if save_charts else None
-    visualizer.plot_trend_analysis(save_path=trend_path)
-
+    visualizer = StockVisualizer(data_with_indicators, symbol)
+    
+    if not save_charts:
+        visualizer.plot_comprehensive_chart(
+            support_levels=levels['support'],
+            resistance_levels=levels['resistance']
+        )
+        visualizer.plot_support_resistance_chart(
+            support_levels=levels['support'],
+            resistance_levels=levels['resistance']
+        )
+        visualizer.plot_trend_analysis()
+        return
+    
+    # Each finished figure is handed to a thread for encoding and writing
+    # while the next one is drawn; zlib and Pillow release the GIL. Figures
+    # are closed in this thread; savefig still works on a closed figure
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        saves = []
+        
+        # Create comprehensive chart
+        fig = visualizer.plot_comprehensive_chart(
+            support_levels=levels['support'],
+            resistance_levels=levels['resistance'],
+            show=False
+        )
+        saves.append(pool.submit(_save_figure, fig,
+                                 os.path.join(output_dir, f"{symbol}_comprehensive.png"), 'Chart'))
+        
+        # Create support/resistance chart
+        fig = visualizer.plot_support_resistance_chart(
+            support_levels=levels['support'],
+            resistance_levels=levels['resistance'],
+            show=False
+        )
+        saves.append(pool.submit(_save_figure, fig,
+                                 os.path.join(output_dir, f"{symbol}_support_resistance.png"),
+                                 'Support/Resistance chart'))
+        
+        # Create trend analysis chart
+        fig = visualizer.plot_trend_analysis(show=False)
+        saves.append(pool.submit(_save_figure, fig,
+                                 os.path.join(output_dir, f"{symbol}_trend_analysis.png"),
+                                 'Trend analysis chart'))
+        
+        for save in saves:
+            save.result()
 
 if __name__ == "__main__":
     # Example usage